@@ -4,15 +4,11 @@ This module holds the application's configuration and constants.
 It loads environment variables and defines file paths and critical error types.
 """
 
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-from instagrapi.exceptions import (
-    LoginRequired, BadPassword, ChallengeRequired,
-    SentryBlock, ProxyAddressIsBlocked, ClientForbiddenError
-)
-
 # Load environment variables from a .env file
 load_dotenv()
 
@@ -34,9 +30,52 @@ BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 # This value should be generated using the 'utils/secret_hasher.py' script.
 HASHED_SECRET_COMMAND = os.getenv("HASHED_SECRET_COMMAND")
 
+# The length range of the secret command. Messages outside of it are rejected before
+# the costly Argon2 verification. The defaults accept any length Telegram allows.
+SECRET_CMD_MIN_LEN = int(os.getenv("SECRET_CMD_MIN_LEN", "1"))
+SECRET_CMD_MAX_LEN = int(os.getenv("SECRET_CMD_MAX_LEN", "4096"))
+
+# Argon2 parameters: time cost, memory cost (in KiB) and parallelism.
+# They only affect newly generated hashes ('utils/secret_hasher.py' reads the same variables).
+# Verifying HASHED_SECRET_COMMAND always uses the parameters stored in the hash itself.
+ARGON2_TIME_COST = int(os.getenv("ARGON2_T", "1"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_M", "8192"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_P", "1"))
+
+# A random key and the HMAC-SHA256 tag of the secret command under that key, both hex-encoded.
+# When both are set, the command is checked with a cheap HMAC instead of the Argon2 hash.
+# These values are also generated by the 'utils/secret_hasher.py' script.
+_secret_cmd_key = os.getenv("SECRET_CMD_KEY")
+_secret_cmd_tag = os.getenv("SECRET_CMD_TAG")
+SECRET_CMD_KEY = bytes.fromhex(_secret_cmd_key) if _secret_cmd_key else None
+SECRET_CMD_TAG = bytes.fromhex(_secret_cmd_tag) if _secret_cmd_tag else None
+
+# --- Concurrency Configuration ---
+# Maximum number of worker threads used for blocking calls offloaded with 'asyncio.to_thread'.
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", "64"))
+
+# Maximum number of Instagram requests that may run at the same time.
+# Instagram rate-limits parallel requests, so this should stay small.
+IG_CONCURRENCY = int(os.getenv("IG_CONCURRENCY", "4"))
+
+# Number of seconds a live stream check result is reused for repeated queries.
+LIVE_CACHE_TTL = float(os.getenv("LIVE_CACHE_TTL", "30"))
+
 # --- Critical Instagram Errors ---
-# These exceptions indicate a fundamental problem with the Instagram session.
-CRITICAL_INSTAGRAM_EXCEPTIONS = (
-    LoginRequired, BadPassword, ChallengeRequired,
-    SentryBlock, ProxyAddressIsBlocked, ClientForbiddenError
-)
+# The 'instagrapi' package is heavy to import, so its exception classes are only
+# loaded the first time they are needed rather than when the config is imported.
+@functools.cache
+def critical_instagram_exceptions() -> tuple[type[Exception], ...]:
+    """
+    Returns the exceptions that indicate a fundamental problem with the Instagram session.
+
+    The tuple can be used directly in an 'except' clause or with 'isinstance'.
+    """
+    from instagrapi.exceptions import (
+        LoginRequired, BadPassword, ChallengeRequired,
+        SentryBlock, ProxyAddressIsBlocked, ClientForbiddenError
+    )
+    return (
+        LoginRequired, BadPassword, ChallengeRequired,
+        SentryBlock, ProxyAddressIsBlocked, ClientForbiddenError
+    )
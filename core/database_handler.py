@@ -3,6 +3,7 @@
 This module handles all database operations for the application,
 such as initializing the database and managing the admins table.
 """
+import asyncio
 import sqlite3
 import logging
 from pathlib import Path
@@ -14,25 +15,34 @@ from . import shared_state
 # Get a logger instance for this module.
 logger = logging.getLogger(__name__)
 
+# A single connection shared by all database operations.
+# It's opened once in 'initialize_database' to avoid reconnecting on every call.
+_CONN: sqlite3.Connection | None = None
+
 
 def initialize_database():
     """
     Initializes the SQLite database and creates the necessary tables if they don't exist.
     This function should be called once at application startup.
     """
+    global _CONN
     try:
-        # The 'with' statement ensures the connection is closed even if errors occur.
-        with sqlite3.connect(DATABASE_FILE) as conn:
-            cursor = conn.cursor()
-
-            # Create the 'admins' table.
-            # 'user_id' is an integer and the primary key for uniqueness.
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS admins (
-                    user_id INTEGER PRIMARY KEY
-                );
-            """)
-            # The commit is automatic when the 'with' block exits successfully.
+        # 'isolation_level=None' puts the connection in autocommit mode, so
+        # transactions are controlled explicitly with BEGIN/COMMIT.
+        _CONN = sqlite3.connect(DATABASE_FILE, isolation_level=None, check_same_thread=False)
+
+        # WAL journaling with NORMAL sync turns each commit into a single log append.
+        _CONN.execute("PRAGMA journal_mode=WAL;")
+        _CONN.execute("PRAGMA synchronous=NORMAL;")
+        _CONN.execute("PRAGMA temp_store=MEMORY;")
+
+        # Create the 'admins' table.
+        # 'user_id' is an integer and the primary key for uniqueness.
+        _CONN.execute("""
+            CREATE TABLE IF NOT EXISTS admins (
+                user_id INTEGER PRIMARY KEY
+            );
+        """)
         logger.info("[Database] Database initialized successfully.")
     except sqlite3.Error as e:
         logger.error(f"[Database] An error occurred during database initialization: {e}")
@@ -43,40 +53,83 @@ def load_admins():
     Loads all admin user_ids from the database into the shared_state.super_admins set.
     This is called at startup to populate the in-memory admin list.
     """
-    try:
-        with sqlite3.connect(DATABASE_FILE) as conn:
-            cursor = conn.cursor()
+    if _CONN is None:
+        logger.error("[Database] Cannot load admins: the database is not initialized.")
+        return
 
-            cursor.execute("SELECT user_id FROM admins;")
-            # fetchall() returns a list of tuples, e.g., [(123,), (456,)]
-            rows = cursor.fetchall()
-
-            # Use a set comprehension to efficiently populate the in-memory set.
-            shared_state.super_admins = {row[0] for row in rows}
+    try:
+        # The set is updated in place, so modules holding a reference to it stay in sync.
+        admins = shared_state.super_admins
+        admins.clear()
+        admins.update(row[0] for row in _CONN.execute("SELECT user_id FROM admins;"))
 
         logger.info(f"[Database] Loaded {len(shared_state.super_admins)} admins from the database.")
     except sqlite3.Error as e:
         logger.error(f"[Database] An error occurred while loading admins: {e}")
 
 
-def save_admins():
+def save_admins() -> bool:
     """
     Saves the current set of admin user_ids from shared_state into the database.
-    This function overwrites the existing table content to ensure consistency.
+    Only the differences between the stored and in-memory sets are written.
+
+    Returns
+    -------
+    bool
+        True if the admins were saved, False if the write failed.
     """
+    if _CONN is None:
+        logger.error("[Database] Cannot save admins: the database is not initialized.")
+        return False
+
     try:
-        with sqlite3.connect(DATABASE_FILE) as conn:
-            cursor = conn.cursor()
+        # The stored set is read and both changes are applied in a single transaction,
+        # so nothing can change the table in between. If any command fails, the
+        # transaction is rolled back.
+        _CONN.execute("BEGIN IMMEDIATE;")
+        try:
+            current = {row[0] for row in _CONN.execute("SELECT user_id FROM admins;")}
+            to_add = shared_state.super_admins - current
+            to_remove = current - shared_state.super_admins
+            _CONN.executemany("INSERT OR IGNORE INTO admins (user_id) VALUES (?);",
+                              [(admin_id,) for admin_id in to_add])
+            _CONN.executemany("DELETE FROM admins WHERE user_id = ?;",
+                              [(admin_id,) for admin_id in to_remove])
+            _CONN.execute("COMMIT;")
+        except sqlite3.Error:
+            _CONN.execute("ROLLBACK;")
+            raise
 
-            # Prepare data for executemany, which requires a list of tuples.
-            admin_ids_to_save = [(admin_id,) for admin_id in shared_state.super_admins]
+        logger.info(f"[Database] Saved admins to the database ({len(to_add)} added, {len(to_remove)} removed).")
+        return True
+    except sqlite3.Error as e:
+        logger.error(f"[Database] An error occurred while saving admins: {e}")
+        return False
 
-            # The 'with' block automatically handles the transaction.
-            # If any command fails, the transaction is rolled back.
-            # If all commands succeed, it's committed upon exiting the block.
-            cursor.execute("DELETE FROM admins;")
-            cursor.executemany("INSERT INTO admins (user_id) VALUES (?);", admin_ids_to_save)
 
-        logger.info(f"[Database] Saved {len(admin_ids_to_save)} admins to the database.")
-    except sqlite3.Error as e:
-        logger.error(f"[Database] An error occurred while saving admins: {e}")
\ No newline at end of file
+async def run_admin_flusher(interval: float = 1.0):
+    """
+    Periodically writes the admin set to the database if it has changed.
+
+    Handlers only set 'shared_state.admins_dirty', so several changes made in quick
+    succession are saved with a single write. The write runs in a worker thread so
+    the event loop never blocks on disk. A failed write is retried on the next pass.
+    This coroutine runs until it's cancelled; a write in progress is finished first.
+
+    Parameters
+    ----------
+    interval : float, optional
+        The number of seconds between checks. Defaults to 1.0.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        if shared_state.admins_dirty:
+            # Clear the flag first, so changes made during the write are saved on the next pass.
+            shared_state.admins_dirty = False
+            write = asyncio.create_task(asyncio.to_thread(save_admins))
+            try:
+                await asyncio.shield(write)
+            finally:
+                # Cancelling the flusher doesn't stop the thread, so the write is awaited here.
+                if not await write:
+                    shared_state.admins_dirty = True
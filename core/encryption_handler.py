@@ -5,22 +5,48 @@ such as the Instagram credentials file. It uses the AES-GCM algorithm
 provided by the 'cryptography' library's Fernet implementation.
 """
 
+import functools
 import logging
 import os
-import json
 from cryptography.fernet import Fernet, InvalidToken
 
+# Use the faster 'orjson' encoder when it's installed, falling back to the standard library.
+# Both variants of '_dumps' return bytes and both variants of '_loads' accept bytes.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data).encode('utf-8')
+
+    def _loads(data: bytes) -> dict:
+        return json.loads(data.decode('utf-8'))
+
 
 logger = logging.getLogger(__name__)
 
 
-# The encryption key is loaded from an environment variable for security.
-# Storing sensitive keys directly in the code is highly discouraged.
-key = os.getenv("ENCRYPTION_KEY")
-if not key:
-    raise ValueError("ENCRYPTION_KEY is not set in the environment variables.")
+@functools.lru_cache(maxsize=1)
+def _get_cipher() -> Fernet:
+    """
+    Creates the Fernet cipher on first use and reuses it for all later calls.
 
-cipher_suite = Fernet(key.encode())
+    The encryption key is loaded from an environment variable for security.
+    Storing sensitive keys directly in the code is highly discouraged.
+
+    Raises
+    ------
+    ValueError
+        If ENCRYPTION_KEY is not set in the environment variables.
+    """
+    key = os.getenv("ENCRYPTION_KEY")
+    if not key:
+        raise ValueError("ENCRYPTION_KEY is not set in the environment variables.")
+    return Fernet(key.encode())
 
 
 def encrypt_data(data: dict) -> bytes:
@@ -37,9 +63,8 @@ def encrypt_data(data: dict) -> bytes:
     bytes
         The encrypted data as bytes.
     """
-    # The dictionary is converted to a JSON string, then to bytes for encryption.
-    plaintext = json.dumps(data).encode('utf-8')
-    return cipher_suite.encrypt(plaintext)
+    # The dictionary is serialized straight to JSON bytes for encryption.
+    return _get_cipher().encrypt(_dumps(data))
 
 
 def decrypt_data(encrypted_data: bytes) -> dict:
@@ -56,14 +81,21 @@ def decrypt_data(encrypted_data: bytes) -> dict:
     dict
         The decrypted dictionary. Returns an empty dictionary if decryption fails
         (e.g., due to an invalid key or corrupted data).
+
+    Raises
+    ------
+    ValueError
+        If ENCRYPTION_KEY is not set in the environment variables.
     """
+    # Obtained outside the 'try' block, so a missing key fails loudly instead of
+    # being reported as a failed decryption.
+    cipher = _get_cipher()
     try:
-        decrypted_plaintext = cipher_suite.decrypt(encrypted_data)
-        # The decrypted bytes are converted back to a string, then parsed as JSON.
-        return json.loads(decrypted_plaintext.decode('utf-8'))
+        # The decrypted bytes are parsed as JSON directly.
+        return _loads(cipher.decrypt(encrypted_data))
     except InvalidToken:
         logger.error("[Encryption] Decryption failed: Invalid token or key. Returning empty credentials.")
         return {}
     except Exception as e:
         logger.error(f"[Encryption] An unexpected error occurred during decryption: {e}")
-        return {}
\ No newline at end of file
+        return {}
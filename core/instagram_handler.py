@@ -2,55 +2,143 @@
 """
 This module handles all interactions with the Instagrapi library,
 including credential management, login procedures, and live stream checks.
+
+The 'instagrapi' package is heavy to import, so it's only imported inside the
+functions that need it, the first time one of them runs.
 """
+from __future__ import annotations
 
 import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from pyrogram.types import Message
 
 # --- Integration libraries ---
-from instagrapi import Client as InstagrapiClient
-
-# --- Instagrapi exception imports ---
-from instagrapi.exceptions import (
-    UserNotFound, FeedbackRequired, BadPassword,
-    LoginRequired, ChallengeRequired, SentryBlock,
-    ProxyAddressIsBlocked, ClientForbiddenError
-)
+if TYPE_CHECKING:
+    from instagrapi import Client as InstagrapiClient
 
 # --- Local Imports ---
-from .config import CREDENTIALS_FILE, SESSION_FILE, CRITICAL_INSTAGRAM_EXCEPTIONS
+from .config import CREDENTIALS_FILE, SESSION_FILE, critical_instagram_exceptions
 from . import shared_state
 from .encryption_handler import encrypt_data, decrypt_data
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class LiveResult:
+    """
+    The outcome of a live stream check.
+
+    Attributes
+    ----------
+    status : str
+        One of "success", "private" or "error".
+    live : bool
+        True if the user is currently broadcasting. Only meaningful on success.
+    broadcast_id : str
+        The ID of the live broadcast, if the user is live.
+    mpd_url : str
+        The DASH (MPD) playback URL of the broadcast, if the user is live.
+    message : str
+        A human-readable explanation for the "private" and "error" statuses.
+    """
+    status: str
+    live: bool = False
+    broadcast_id: str = ""
+    mpd_url: str = ""
+    message: str = ""
+
+
+# The credentials as they were last written to (or read from) disk, with the file's mtime.
+# Used to skip decrypting an unchanged file and to skip rewriting unchanged credentials.
+_cred_cache: dict = {"mtime": None, "data": None}
+
+# The session settings as they were last written to (or read from) the session file.
+# Used to skip re-encrypting and rewriting a session that hasn't changed.
+_last_session_settings: dict | None = None
+
+# The instagrapi client of the current login. Restoring a saved session reuses it with the
+# session's settings, so its HTTP session and keep-alive connections survive a re-login.
+_client: InstagrapiClient | None = None
+
+
 # --- Credential Management Logic ---
 def load_credentials():
     """
     Loads and decrypts Instagram credentials from the credentials file into the shared state.
+
+    If the file hasn't changed since it was last loaded or saved, the cached copy is used
+    instead of decrypting it again.
     """
-    if CREDENTIALS_FILE.exists():
-        with open(CREDENTIALS_FILE, "rb") as f:
-            encrypted_data = f.read()
-        shared_state.ig_credentials = decrypt_data(encrypted_data)
-        logger.info('[Credentials] Decrypted credentials loaded from file.')
-    else:
+    try:
+        mtime = CREDENTIALS_FILE.stat().st_mtime_ns
+        if mtime == _cred_cache["mtime"]:
+            shared_state.ig_credentials = dict(_cred_cache["data"])
+            logger.debug('[Credentials] Credentials file unchanged, using cached credentials.')
+            return
+        encrypted_data = CREDENTIALS_FILE.read_bytes()
+    except FileNotFoundError:
         logger.warning('[Credentials] credentials.enc file not found.')
+        return
+
+    shared_state.ig_credentials = decrypt_data(encrypted_data)
+    _cred_cache["mtime"] = mtime
+    _cred_cache["data"] = dict(shared_state.ig_credentials)
+    logger.info('[Credentials] Decrypted credentials loaded from file.')
 
 
 def save_credentials():
     """
     Encrypts and saves the current Instagram credentials from shared state to the credentials file.
+    The write is skipped if the credentials are unchanged since they were last saved.
     """
+    if shared_state.ig_credentials == _cred_cache["data"] and CREDENTIALS_FILE.exists():
+        logger.debug('[Credentials] Credentials unchanged, skipping save.')
+        return
+
     encrypted_data = encrypt_data(shared_state.ig_credentials)
     with open(CREDENTIALS_FILE, "wb") as f:
         f.write(encrypted_data)
+    _cred_cache["mtime"] = CREDENTIALS_FILE.stat().st_mtime_ns
+    _cred_cache["data"] = dict(shared_state.ig_credentials)
     logger.info('[Credentials] Encrypted credentials saved to file.')
 
 
+async def aload_credentials():
+    """
+    Async version of 'load_credentials'.
+    The whole read-and-decrypt chain runs in a single worker thread, so the event loop never blocks on disk.
+    """
+    await asyncio.to_thread(load_credentials)
+
+
+async def asave_credentials():
+    """
+    Async version of 'save_credentials'.
+    The whole encrypt-and-write chain runs in a single worker thread, so the event loop never blocks on disk.
+    """
+    await asyncio.to_thread(save_credentials)
+
+
+def delete_session_files():
+    """
+    Deletes the session and credentials files if they exist.
+    This is a blocking call and should be run in a separate thread from async code.
+    """
+    SESSION_FILE.unlink(missing_ok=True)
+    CREDENTIALS_FILE.unlink(missing_ok=True)
+    _cred_cache["mtime"] = None
+    _cred_cache["data"] = None
+    global _last_session_settings
+    _last_session_settings = None
+
+
 # --- Instagram Login Logic ---
 def perform_instagram_login(username, password) -> InstagrapiClient:
     """
@@ -70,15 +158,20 @@ def perform_instagram_login(username, password) -> InstagrapiClient:
     Returns
     -------
     InstagrapiClient
-        An authenticated instagrapi.Client instance.
+        An authenticated instagrapi.Client instance. Restoring a saved session reuses the
+        current instance; a password login always gets a fresh one.
 
     Raises
     ------
-    CRITICAL_INSTAGRAM_EXCEPTIONS
+    critical_instagram_exceptions()
         If a critical, unrecoverable login error occurs.
     """
+    global _client, _last_session_settings
+    from instagrapi import Client as InstagrapiClient
+    from instagrapi.exceptions import LoginRequired
 
-    client = InstagrapiClient()
+    # Device identifiers to carry over to a password login, if a saved session has expired.
+    uuids = None
 
     # ZMIANA: Logika ładowania i zapisywania sesji została zmodyfikowana, aby używać szyfrowania.
     if SESSION_FILE.exists():
@@ -90,36 +183,91 @@ def perform_instagram_login(username, password) -> InstagrapiClient:
 
         # Check if decryption was successful and data is not empty
         if decrypted_settings:
+            _last_session_settings = decrypted_settings
+            # Restoring a session replaces the cookies, so the existing client (and its
+            # HTTP connections) can be reused; it's only created on first use.
+            if _client is None:
+                _client = InstagrapiClient()
+            client = _client
             client.set_settings(decrypted_settings)
+            # Keep the credentials on the client so instagrapi can re-login by itself if needed.
+            client.username = username
+            client.password = password
             logger.info("[Instagrapi] Session decrypted and loaded.")
-            client.login(username, password)
-            client.get_timeline_feed()  # Verify that the session is valid
-            logger.info("[Instagrapi] Session is still valid.")
+            try:
+                # A single request is enough to verify that the session is valid,
+                # so the (rate-limited) password login is skipped entirely.
+                client.get_timeline_feed()
+                logger.info("[Instagrapi] Session is still valid.")
+                # Instagram may have rotated the session cookies in its response. Those are
+                # saved, while an unchanged session isn't rewritten.
+                _save_session(client)
+                _load_following(client)
+                return client
+            except LoginRequired:
+                logger.warning("[Instagrapi] Session has expired, proceeding with password login.")
+                # Keep the device identifiers so Instagram sees the same device logging in again.
+                uuids = client.get_settings()["uuids"]
         else:
             # Decryption failed, treat as if no session file exists
             logger.warning("[Instagrapi] Failed to decrypt session file, proceeding with fresh login.")
-            client.login(username, password)
-            logger.info("[Instagrapi] Logged in for the first time (after failed decryption).")
-            # Save the new, valid session
-            encrypted_session_data = encrypt_data(client.get_settings())
-            with open(SESSION_FILE, "wb") as f:
-                f.write(encrypted_session_data)
-            logger.info(f"[Instagrapi] New encrypted session has been saved to {SESSION_FILE.name}.")
-
     else:
         logger.info("[Instagrapi] No session file found. Performing first-time login.")
-        client.login(username, password)
-        logger.info("[Instagrapi] Logged in successfully.")
 
-        # Encrypt and save the new session
-        encrypted_session_data = encrypt_data(client.get_settings())
-        with open(SESSION_FILE, "wb") as f:
-            f.write(encrypted_session_data)
-        logger.info(f"[Instagrapi] New encrypted session has been saved to {SESSION_FILE.name}.")
+    # A password login always starts from a fresh client. instagrapi's 'login' returns early
+    # while old session cookies are present, and the client also caches lookups per account,
+    # so nothing from a previous or expired session may be carried over.
+    client = InstagrapiClient()
+    if uuids:
+        client.set_uuids(uuids)
+    client.login(username, password)
+    _client = client
+    logger.info("[Instagrapi] Logged in successfully.")
+
+    # Encrypt and save the new session
+    _save_session(client)
 
+    _load_following(client)
     return client
 
 
+def _load_following(client: InstagrapiClient):
+    """
+    Fetches the IDs of all accounts the bot follows into 'shared_state.following_pks'.
+
+    The whole list is paged through once per login (one request per 200 followed accounts),
+    so live stream checks on private accounts that are already known to be followed don't
+    need a separate friendship request each. Non-critical errors are logged and leave the
+    previous set in place.
+    """
+    try:
+        # instagrapi caches this list on the client, so it's fetched anew for every login.
+        shared_state.following_pks = set(client.user_following(client.user_id, use_cache=False))
+        logger.info(f"[Instagrapi] Loaded {len(shared_state.following_pks)} followed accounts.")
+    except critical_instagram_exceptions():
+        raise
+    except Exception as e:
+        logger.warning(f"[Instagrapi] Failed to load the followed accounts: {e}")
+
+
+def _save_session(client: InstagrapiClient):
+    """
+    Encrypts the client's current settings and saves them to the session file.
+    The write is skipped if the settings are unchanged since they were last saved or loaded.
+    """
+    global _last_session_settings
+    settings = client.get_settings()
+    if settings == _last_session_settings and SESSION_FILE.exists():
+        logger.debug("[Instagrapi] Session settings unchanged, skipping save.")
+        return
+
+    encrypted_session_data = encrypt_data(settings)
+    with open(SESSION_FILE, "wb") as f:
+        f.write(encrypted_session_data)
+    _last_session_settings = settings
+    logger.info(f"[Instagrapi] New encrypted session has been saved to {SESSION_FILE.name}.")
+
+
 def mask_password(password: str) -> str:
     """Masks a password, showing only the first and last characters."""
     if len(password) > 2:
@@ -127,10 +275,89 @@ def mask_password(password: str) -> str:
     return "*" * len(password)
 
 
+def _handle_login_exception(e: Exception, username: str, password: str,
+                            manual_first_attempt: bool = False) -> str:
+    """
+    Logs a failed login, resets the saved credentials if they are invalid,
+    and returns the message that should be shown to the user.
+
+    This is a blocking call (it may delete files) and should be run in a separate
+    thread from async code.
+
+    Parameters
+    ----------
+    e : Exception
+        The exception raised by the login attempt.
+    username : str
+        The Instagram username used for the attempt.
+    password : str
+        The Instagram password used for the attempt.
+    manual_first_attempt : bool, optional
+        If True, invalid credentials are reported without being deleted,
+        assuming it's a user's first manual attempt. Defaults to False.
+
+    Returns
+    -------
+    str
+        A user-facing description of the failure.
+    """
+    from instagrapi.exceptions import (
+        BadPassword, LoginRequired, ChallengeRequired,
+        SentryBlock, ProxyAddressIsBlocked, ClientForbiddenError
+    )
+
+    if isinstance(e, (BadPassword, LoginRequired)):
+        error_type = "Invalid password" if isinstance(e, BadPassword) else "Session expired"
+
+        # If this is a user-initiated first attempt, inform them without deleting credentials.
+        if manual_first_attempt:
+            logger.warning(f"[Instagrapi] Failed first login attempt: {error_type}.")
+            masked_pass = mask_password(password)
+            return (
+                f"⚠️ **Login Failed:** {error_type}.\n\n"
+                f"Please check your current credentials:\n"
+                f"▫️ **Username:** `{username}`\n"
+                f"▫️ **Password:** `{masked_pass}`\n\n"
+                "You can correct them using the commands:\n"
+                "`/setlogin <new_username>`\n"
+                "`/setpassword <new_password>`"
+            )
+
+        # Otherwise, the saved credentials are bad (e.g., on startup or during a check).
+        # Perform a hard reset of credentials.
+        logger.error(f"--- ERROR: {error_type}. ---")
+        delete_session_files()
+        shared_state.ig_credentials = {}
+        logger.warning("[Credentials] Deleted invalid session and credentials files.")
+        return f"⚠️ **Login Failed:** {error_type}. Your saved credentials have been cleared. Please set them again.\n\n`{e}`"
+
+    # Catch other critical errors
+    logger.critical(f"--- CRITICAL ERROR: An unexpected error occurred during login: {e} ---")
+    # Describe other specific, critical errors
+    if isinstance(e, ChallengeRequired):
+        return f"⚠️ **Login Failed:** Account verification required (checkpoint). Please log in via the app or browser to resolve this.\n\n`{e}`"
+    elif isinstance(e, (SentryBlock, ProxyAddressIsBlocked)):
+        return f"⚠️ **Login Failed:** Your IP address has been blocked by Instagram. Please change your proxy or IP address.\n\n`{e}`"
+    elif isinstance(e, ClientForbiddenError):
+        return f"⚠️ **Login Failed:** It appears the Instagram account has been suspended or disabled.\n\n`{e}`"
+    return f"⚠️ **Critical Error:** An unexpected error occurred during login.\n\n`{e}`"
+
+
+def _saved_credentials() -> tuple[str | None, str | None]:
+    """
+    Returns the saved username and password, or None for each one that isn't set.
+    An empty dict (no saved login) is the common case, so it skips both lookups.
+    """
+    creds = shared_state.ig_credentials
+    if not creds:
+        return None, None
+    return creds.get("username"), creds.get("password")
+
+
 async def attempt_login(message: Message | None = None, manual_first_attempt: bool = False):
     """
-    Universal login wrapper. Can be called on startup (without a message)
-    or by a command (with a message to reply to).
+    Login wrapper for commands, with a message to reply to.
+    It can also be called without a message, in which case nothing is sent.
 
     Parameters
     ----------
@@ -142,11 +369,12 @@ async def attempt_login(message: Message | None = None, manual_first_attempt: bo
     """
     shared_state.instagrapi_client = None
 
-    username = shared_state.ig_credentials.get("username")
-    password = shared_state.ig_credentials.get("password")
+    # Refresh the credentials from disk without blocking the event loop.
+    await aload_credentials()
+
+    username, password = _saved_credentials()
 
     if not (username and password):
-        # This will only be reached if called on startup without credentials, which is fine.
         # If called by a command, the handler should check this first.
         logger.warning("[Instagrapi] Login attempt skipped: credentials not found.")
         return
@@ -161,68 +389,80 @@ async def attempt_login(message: Message | None = None, manual_first_attempt: bo
         if message:
             await message.reply_text("✅ Successfully logged in to Instagram!")
 
-    except (BadPassword, LoginRequired) as e:
-        error_type = "Invalid password" if isinstance(e, BadPassword) else "Session expired"
-
-        # If this is a user-initiated first attempt, inform them without deleting credentials.
-        if manual_first_attempt and message:
-            logger.warning(f"[Instagrapi] Failed first login attempt: {error_type}.")
-            masked_pass = mask_password(password)
-            await message.reply_text(
-                f"⚠️ **Login Failed:** {error_type}.\n\n"
-                f"Please check your current credentials:\n"
-                f"▫️ **Username:** `{username}`\n"
-                f"▫️ **Password:** `{masked_pass}`\n\n"
-                "You can correct them using the commands:\n"
-                "`/setlogin <new_username>`\n"
-                "`/setpassword <new_password>`"
-            )
-        else:
-            # Otherwise, the saved credentials are bad (e.g., on startup or during a check).
-            # Perform a hard reset of credentials.
-            logger.error(f"--- ERROR: {error_type}. ---")
-            if SESSION_FILE.exists(): SESSION_FILE.unlink()
-            if CREDENTIALS_FILE.exists(): CREDENTIALS_FILE.unlink()
-            shared_state.ig_credentials = {}
-            logger.warning("[Credentials] Deleted invalid session and credentials files.")
-            if message:
-                await message.reply_text(
-                    f"⚠️ **Login Failed:** {error_type}. Your saved credentials have been cleared. Please set them again.\n\n`{e}`")
-
     except Exception as e:
-        # Catch other critical errors
-        logger.critical(f"--- CRITICAL ERROR: An unexpected error occurred during login: {e} ---")
+        error_text = await asyncio.to_thread(
+            _handle_login_exception, e, username, password, manual_first_attempt and message is not None
+        )
         if message:
-            # Inform user about other specific, critical errors
-            if isinstance(e, ChallengeRequired):
-                await message.reply_text(
-                    f"⚠️ **Login Failed:** Account verification required (checkpoint). Please log in via the app or browser to resolve this.\n\n`{e}`")
-            elif isinstance(e, (SentryBlock, ProxyAddressIsBlocked)):
-                await message.reply_text(
-                    f"⚠️ **Login Failed:** Your IP address has been blocked by Instagram. Please change your proxy or IP address.\n\n`{e}`")
-            elif isinstance(e, ClientForbiddenError):
-                await message.reply_text(
-                    f"⚠️ **Login Failed:** It appears the Instagram account has been suspended or disabled.\n\n`{e}`")
-            else:
-                await message.reply_text(f"⚠️ **Critical Error:** An unexpected error occurred during login.\n\n`{e}`")
+            await message.reply_text(error_text)
 
 
 def startup_login():
     """
-    Synchronous function to be called on application startup.
-    It runs the asynchronous 'attempt_login' in a new asyncio event loop.
-    This prevents conflicts with Pyrogram's event loop.
+    Synchronous function to be called on application startup, before the bot starts.
+
+    The login itself is a blocking call and nothing else is running yet, so it's
+    performed directly on the main thread without setting up an event loop.
     """
     logger.info("[Startup] Attempting to log in to Instagram if credentials exist...")
+
+    username, password = _saved_credentials()
+
+    if not (username and password):
+        # This is expected on the first run, before any credentials have been set.
+        logger.warning("[Instagrapi] Login attempt skipped: credentials not found.")
+        return
+
     try:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(attempt_login())
+        shared_state.instagrapi_client = perform_instagram_login(username, password)
+        logger.info("[Instagrapi] Successfully logged in and initialized the client.")
     except Exception as e:
-        logger.error(f"[Startup] An error occurred during the initial login attempt: {e}")
+        # Handling the failure may itself fail (e.g., deleting the files); that must not stop the bot.
+        try:
+            _handle_login_exception(e, username, password)
+        except Exception as handler_error:
+            logger.error(f"[Startup] An error occurred during the initial login attempt: {handler_error}")
 
 
 # --- Instagrapi Core Function ---
-def check_livestream(cl: InstagrapiClient, username: str) -> dict:
+# Cache of user lookups: lowercased username -> (user_id, is_private, timestamp).
+# An account's privacy status can change, so entries are kept for a limited time only.
+# Ordered from least to most recently used, so the oldest entry is evicted first.
+_user_cache: OrderedDict[str, tuple[str, bool, float]] = OrderedDict()
+_USER_CACHE_TTL = 600
+_USER_CACHE_MAX_SIZE = 1024
+# Checks run in several worker threads at once, so the cache is only changed under this lock.
+_user_cache_lock = threading.Lock()
+
+
+def _get_user(cl: InstagrapiClient, username: str, ttl: float = _USER_CACHE_TTL) -> tuple[str, bool]:
+    """
+    Returns the user ID and privacy status of a user, using the cache when possible.
+
+    Only calls 'user_info_by_username' when the user isn't cached or the entry has expired.
+    Expired entries are dropped, and the least recently used one is evicted when the cache is full.
+    """
+    key = username.lower()
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+        if entry:
+            if time.monotonic() - entry[2] < ttl:
+                _user_cache.move_to_end(key)
+                return entry[0], entry[1]
+            del _user_cache[key]
+
+    logger.debug(f"[Instagrapi] Getting user info for {username}...")
+    # instagrapi keeps its own cache of this lookup without any expiry, so it's bypassed here.
+    user_info = cl.user_info_by_username(username, use_cache=False)
+    with _user_cache_lock:
+        _user_cache[key] = (user_info.pk, user_info.is_private, time.monotonic())
+        _user_cache.move_to_end(key)
+        if len(_user_cache) > _USER_CACHE_MAX_SIZE:
+            _user_cache.popitem(last=False)
+    return user_info.pk, user_info.is_private
+
+
+def check_livestream(cl: InstagrapiClient, username: str) -> LiveResult:
     """
     Checks if a given Instagram user is currently live-streaming.
 
@@ -238,53 +478,58 @@ def check_livestream(cl: InstagrapiClient, username: str) -> dict:
 
     Returns
     -------
-    dict
-        A dictionary containing the status of the check.
-        On success: `{"status": "success", "live": True, ...}` or `{"status": "success", "live": False}`
-        On private: `{"status": "private", "message": "..."}`
-        On error: `{"status": "error", "message": "..."}`
+    LiveResult
+        The status of the check.
+        On success: `LiveResult("success", live=True, ...)` or `LiveResult("success", live=False)`
+        On private: `LiveResult("private", message="...")`
+        On error: `LiveResult("error", message="...")`
     """
+    from instagrapi.exceptions import UserNotFound, FeedbackRequired
+
     try:
         # First, retrieve basic user information to check their privacy status.
-        logger.debug(f"[Instagrapi] Getting user info for {username}...")
-        user_info = cl.user_info_by_username(username)
+        user_id, is_private = _get_user(cl, username)
 
         # Check if the account is private.
-        if user_info.is_private:
+        if is_private:
             # To check a livestream on a private account, the bot must be following it.
-            # We fetch the friendship status to verify this.
-            friendship = cl.user_friendship_v1(user_info.pk)
-            if not friendship.following:
-                logger.debug(f"[Instagrapi] User {username} is private and not followed by the bot.")
-                return {
-                    "status": "private",
-                    "message": f"The account '{username}' is private. The bot must follow it to check the live stream status."
-                }
+            # The followed accounts loaded at login answer this without a request. An account
+            # followed since then isn't in the set yet, so a miss is checked with Instagram.
+            if user_id not in shared_state.following_pks:
+                if not cl.user_friendship_v1(user_id).following:
+                    logger.debug(f"[Instagrapi] User {username} is private and not followed by the bot.")
+                    return LiveResult(
+                        "private",
+                        message=f"The account '{username}' is private. The bot must follow it to check the live stream status."
+                    )
+                shared_state.following_pks.add(user_id)
 
         # If the account is public, or private and followed, proceed.
         logger.debug(f"[Instagrapi] Checking live stream for {username}...")
         # Reuse the user_id we've already fetched instead of making another API call.
-        user_id = user_info.pk
         response_data = cl.private_request(f"feed/user/{user_id}/story/")
 
         if broadcast_object := response_data.get("broadcast"):
-            broadcast_id = broadcast_object.get("id")
+            broadcast_id = str(broadcast_object.get("id"))
             mpd_url = broadcast_object.get("dash_playback_url")
             logger.debug(f"[Instagrapi] Live stream found for {username}.")
-            return {"status": "success", "live": True, "broadcast_id": broadcast_id, "mpd_url": mpd_url}
+            return LiveResult("success", live=True, broadcast_id=broadcast_id, mpd_url=mpd_url)
         else:
             logger.debug(f"[Instagrapi] User {username} is not broadcasting.")
-            return {"status": "success", "live": False}
+            return LiveResult("success", live=False)
 
     except UserNotFound:
+        # The account may have been renamed or deleted, so forget any cached lookup.
+        with _user_cache_lock:
+            _user_cache.pop(username.lower(), None)
         logger.debug(f"[Instagrapi] ERROR: User {username} not found.")
-        return {"status": "error", "message": f"User '{username}' not found."}
+        return LiveResult("error", message=f"User '{username}' not found.")
     except FeedbackRequired as _e:
         logger.error(f"[Instagrapi] ERROR: Action blocked (FeedbackRequired) while checking {username}.")
-        return {"status": "error",
-                "message": f"The bot's Instagram account is temporarily blocked. Please try again later.\n\n`{_e}`"}
-    except CRITICAL_INSTAGRAM_EXCEPTIONS:
+        return LiveResult("error",
+                          message=f"The bot's Instagram account is temporarily blocked. Please try again later.\n\n`{_e}`")
+    except critical_instagram_exceptions():
         raise  # Re-throw the exception to be handled globally
     except Exception as _e:
         logger.critical(f"[Instagrapi] An unexpected error occurred while checking {username}: {_e}")
-        return {"status": "error", "message": f"An unexpected internal error occurred: {_e}"}
\ No newline at end of file
+        return LiveResult("error", message=f"An unexpected internal error occurred: {_e}")
\ No newline at end of file
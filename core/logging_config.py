@@ -1,6 +1,7 @@
 # core/logging_config.py
+import atexit
 import logging
-import colorlog
+import logging.config
 from pathlib import Path
 
 
@@ -8,6 +9,129 @@ from pathlib import Path
 # All log files will be stored in this directory. It will be created if it doesn't exist.
 LOGS_DIR = Path("logs")
 
+# The names of the queue handlers defined below. Each one owns a QueueListener
+# that must be started after the configuration has been applied.
+_QUEUE_HANDLERS = ("queue_root", "queue_insta", "queue_pyro", "queue_api_calls")
+
+# The complete logging configuration, applied with 'logging.config.dictConfig'.
+# Loggers are only given QueueHandlers; the actual handlers run on background
+# QueueListener threads, so logging never blocks the caller on formatting or disk I/O.
+LOGGING_CONFIG = {
+    "version": 1,
+    # Module loggers are created at import time, before this config is applied.
+    "disable_existing_loggers": False,
+    "formatters": {
+        "console": {
+            "()": "colorlog.ColoredFormatter",
+            "fmt": "%(white)s%(asctime)s%(reset)s%(log_color)s - %(levelname)-8s -> %(name)s - %(message)s%(reset)s",
+            "datefmt": "%d-%m-%Y %H:%M:%S",
+            "log_colors": {"DEBUG": "cyan", "INFO": "green", "WARNING": "yellow", "ERROR": "red",
+                           "CRITICAL": "red,bg_white"},
+        },
+        "file": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            "datefmt": "%d-%m-%Y %H:%M:%S",
+        },
+    },
+    "handlers": {
+        # --- Console Handler (shows everything from DEBUG up) ---
+        "console": {
+            "class": "colorlog.StreamHandler",
+            "level": "DEBUG",
+            "formatter": "console",
+        },
+        # --- General File Handler (for app-specific warnings) ---
+        "app_file": {
+            "class": "logging.FileHandler",
+            "level": "WARNING",
+            "formatter": "file",
+            "filename": str(LOGS_DIR / "app_warnings.log"),
+            "mode": "a",
+            "encoding": "utf-8",
+        },
+        # --- Instagrapi and Pyrogram Error Files ---
+        "insta_errors": {
+            "class": "logging.FileHandler",
+            "formatter": "file",
+            "filename": str(LOGS_DIR / "insta_errors.log"),
+            "mode": "a",
+            "encoding": "utf-8",
+        },
+        "pyro_errors": {
+            "class": "logging.FileHandler",
+            "formatter": "file",
+            "filename": str(LOGS_DIR / "pyro_errors.log"),
+            "mode": "a",
+            "encoding": "utf-8",
+        },
+        # --- Instagrapi API Calls File (shared by both request loggers) ---
+        "api_calls": {
+            "class": "logging.FileHandler",
+            "level": "INFO",
+            "formatter": "file",
+            "filename": str(LOGS_DIR / "insta_api_calls.log"),
+            "mode": "a",
+            "encoding": "utf-8",
+        },
+        # Every API call is logged, so records are buffered and written in batches.
+        # The buffer is flushed early on errors and when logging shuts down.
+        "api_calls_buffer": {
+            "class": "logging.handlers.MemoryHandler",
+            "capacity": 128,
+            "flushLevel": "ext://logging.ERROR",
+            "target": "api_calls",
+        },
+        # --- Queue Handlers (one queue and listener per group of loggers) ---
+        # A SimpleQueue makes each emit a lock-free put, without the bookkeeping of queue.Queue.
+        "queue_root": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": "queue.SimpleQueue",
+            "handlers": ["console", "app_file"],
+            "respect_handler_level": True,
+        },
+        "queue_insta": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": "queue.SimpleQueue",
+            "handlers": ["insta_errors"],
+            "respect_handler_level": True,
+        },
+        "queue_pyro": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": "queue.SimpleQueue",
+            "handlers": ["pyro_errors"],
+            "respect_handler_level": True,
+        },
+        "queue_api_calls": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": "queue.SimpleQueue",
+            "handlers": ["api_calls_buffer"],
+            "respect_handler_level": True,
+        },
+    },
+    "loggers": {
+        # This logger captures general library warnings and errors from instagrapi.
+        "instagrapi": {"level": "WARNING", "handlers": ["queue_insta"], "propagate": False},
+        "pyrogram": {"level": "WARNING", "handlers": ["queue_pyro"], "propagate": False},
+        # Silencing other verbose loggers.
+        "urllib3": {"level": "WARNING"},
+        # Instagrapi uses separate, non-hierarchical loggers for its API requests.
+        # These are the correct, independent logger names as defined within the instagrapi library.
+        "private_request": {"level": "INFO", "handlers": ["queue_api_calls"], "propagate": False},
+        "public_request": {"level": "INFO", "handlers": ["queue_api_calls"], "propagate": False},
+    },
+    # Set the lowest level to capture everything.
+    "root": {"level": "DEBUG", "handlers": ["queue_root"]},
+}
+
+# Background listeners started by the last call to 'setup_logging'.
+_listeners: list = []
+
+
+def _stop_listeners():
+    """Flushes and stops all queue listeners. Registered to run at interpreter exit."""
+    while _listeners:
+        _listeners.pop().stop()
+
 
 def setup_logging():
     """
@@ -28,76 +152,32 @@ def setup_logging():
     3.  Specific API Call Logger:
         - A shared handler for 'instagrapi.private_request' and 'instagrapi.public_request'
           saves all INFO logs (i.e., every API call) to 'Logs/insta_api_calls.log'.
+          These records are buffered in memory and written in batches of 128.
 
     To prevent duplicate entries and keep the console clean, propagation is disabled for all
     dedicated loggers.
+
+    The whole setup is declared in 'LOGGING_CONFIG' and applied with a single
+    'logging.config.dictConfig' call. Each logger is given only a QueueHandler; the
+    handlers above run on background QueueListener threads, so logging never blocks
+    the caller on formatting or disk I/O.
     """
     # --- 0. Ensure Log Directory Exists ---
     LOGS_DIR.mkdir(exist_ok=True)
 
-    # --- 1. Root Logger Configuration (for console and general app file) ---
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)  # Set the lowest level to capture everything.
-
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
-
-    # --- Console Handler (shows everything from DEBUG up) ---
-    console_handler = colorlog.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
-    console_formatter = colorlog.ColoredFormatter(
-        '%(white)s%(asctime)s%(reset)s%(log_color)s - %(levelname)-8s -> %(name)s - %(message)s%(reset)s',
-        datefmt='%d-%m-%Y %H:%M:%S',
-        log_colors={'DEBUG': 'cyan', 'INFO': 'green', 'WARNING': 'yellow', 'ERROR': 'red', 'CRITICAL': 'red,bg_white'}
-    )
-    console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
-
-    # --- General File Handler (for app-specific warnings) ---
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                                       datefmt='%d-%m-%Y %H:%M:%S')
-    # Use the LOGS_DIR path to place the file inside the 'Logs' folder.
-    app_file_handler = logging.FileHandler(LOGS_DIR / 'app_warnings.log', mode='a', encoding='utf-8')
-    app_file_handler.setLevel(logging.WARNING)
-    app_file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(app_file_handler)
-
-    # --- 2. Dedicated Logger for Instagrapi Errors ---
-    # This logger captures general library warnings and errors from instagrapi.
-    insta_logger = logging.getLogger("instagrapi")
-    insta_logger.setLevel(logging.WARNING)
-    insta_error_handler = logging.FileHandler(LOGS_DIR / 'insta_errors.log', mode='a', encoding='utf-8')
-    insta_error_handler.setFormatter(file_formatter)
-    insta_logger.addHandler(insta_error_handler)
-    insta_logger.propagate = False
-
-    # --- 3. Dedicated Logger for Pyrogram Errors ---
-    pyro_logger = logging.getLogger("pyrogram")
-    pyro_logger.setLevel(logging.WARNING)
-    pyro_error_handler = logging.FileHandler(LOGS_DIR / 'pyro_errors.log', mode='a', encoding='utf-8')
-    pyro_error_handler.setFormatter(file_formatter)
-    pyro_logger.addHandler(pyro_error_handler)
-    pyro_logger.propagate = False
-
-    # --- 4. Silencing other verbose loggers ---
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-
-    # --- 5. Dedicated Logger for Instagrapi API Calls ---
-    # Instagrapi uses separate, non-hierarchical loggers for its API requests.
-    # We capture their INFO-level logs to create a record of all API calls.
-    api_calls_handler = logging.FileHandler(LOGS_DIR / 'insta_api_calls.log', mode='a', encoding='utf-8')
-    api_calls_handler.setLevel(logging.INFO)
-    api_calls_handler.setFormatter(file_formatter)
-
-    # These are the correct, independent logger names as defined within the instagrapi library.
-    private_req_logger = logging.getLogger("private_request")
-    public_req_logger = logging.getLogger("public_request")
-
-    private_req_logger.setLevel(logging.INFO)
-    public_req_logger.setLevel(logging.INFO)
-
-    private_req_logger.addHandler(api_calls_handler)
-    public_req_logger.addHandler(api_calls_handler)
-
-    private_req_logger.propagate = False
-    public_req_logger.propagate = False
\ No newline at end of file
+    # Stop listeners from any previous call before the handlers are replaced.
+    _stop_listeners()
+
+    # --- 1. Apply the Configuration ---
+    logging.config.dictConfig(LOGGING_CONFIG)
+
+    # --- 2. Start the Queue Listeners ---
+    # dictConfig creates a listener for each QueueHandler but doesn't start it.
+    for name in _QUEUE_HANDLERS:
+        listener = logging.getHandlerByName(name).listener
+        listener.start()
+        _listeners.append(listener)
+
+    # Make sure queued records are written out when the application exits.
+    atexit.unregister(_stop_listeners)
+    atexit.register(_stop_listeners)
@@ -3,8 +3,13 @@
 This module contains the shared state of the application to avoid circular imports.
 It holds the global instance of the Instagrapi client and the Instagram credentials.
 """
+from __future__ import annotations
 
-from instagrapi import Client as InstagrapiClient
+from typing import TYPE_CHECKING
+
+# Only needed for the annotation below; 'instagrapi' itself is imported lazily.
+if TYPE_CHECKING:
+    from instagrapi import Client as InstagrapiClient
 
 # Global variable for storing the instagrapi client instance.
 # It's initialized as None and gets populated upon successful login.
@@ -14,5 +19,14 @@ instagrapi_client: InstagrapiClient | None = None
 ig_credentials: dict = {}
 
 # A set to store the user IDs of super-admins in memory.
-# This set is populated from the database on startup.
-super_admins: set[int] = set()
\ No newline at end of file
+# This set is populated from the database on startup. It's only ever modified in place,
+# never reassigned, so a reference to it can be kept at import time.
+super_admins: set[int] = set()
+
+# Set when 'super_admins' has changed in memory and still needs to be written to the database.
+admins_dirty: bool = False
+
+# The user IDs of all accounts the bot's Instagram account follows.
+# It's loaded after each successful login, and accounts followed since then are added
+# as live stream checks find them.
+following_pks: set[str] = set()
@@ -4,16 +4,20 @@ This is the main entry point for the application.
 It initializes the configuration, loads credentials, and starts the Telegram bot.
 """
 
+import asyncio
+import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pyrogram import idle
 
 from core.logging_config import setup_logging
 
 # --- Local Imports ---
-from core.config import API_ID, API_HASH, BOT_TOKEN, DATA_DIR
+from core.config import API_ID, API_HASH, BOT_TOKEN, DATA_DIR, THREAD_POOL_SIZE
 from core.instagram_handler import load_credentials, startup_login
-from core.database_handler import initialize_database, load_admins
+from core import shared_state
+from core.database_handler import initialize_database, load_admins, save_admins, run_admin_flusher
 from telegram.bot import app
 
 
@@ -48,6 +52,20 @@ if __name__ == "__main__":
         )
         sys.exit(1)
 
+    # The encryption key is only used once credentials are read or saved, so a missing
+    # key is reported here instead of in the middle of a command.
+    if not os.getenv("ENCRYPTION_KEY"):
+        logger.error(
+            "FATAL: ENCRYPTION_KEY is not set. "
+            "Please check your .env file or environment secrets."
+        )
+        sys.exit(1)
+
+    # --- Thread Pool Configuration ---
+    # Blocking work (Instagram calls, disk writes) is offloaded with 'asyncio.to_thread',
+    # which uses the loop's default executor. Size it for concurrent users.
+    app.loop.set_default_executor(ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE))
+
     # Load encrypted Instagram credentials if they exist.
     load_credentials()
 
@@ -59,7 +77,18 @@ if __name__ == "__main__":
     app.start()
     logger.info("[Pyrogram] The bot has been launched! Send the /start command.")
 
+    # Admin changes are written to the database in batches by a background task.
+    flusher = app.loop.create_task(run_admin_flusher())
+
     # Keep the bot running until it's manually stopped (e.g., with Ctrl+C).
     idle()
 
+    # Stop the flusher and wait for it, so its last write can't overlap the final save below.
+    flusher.cancel()
+    app.loop.run_until_complete(asyncio.gather(flusher, return_exceptions=True))
+
+    # Write out any admin changes the flusher hasn't saved yet.
+    if shared_state.admins_dirty:
+        save_admins()
+
     logger.info("[Pyrogram] The bot has been stopped.")
\ No newline at end of file
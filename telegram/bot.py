@@ -5,9 +5,22 @@ It configures the bot with API credentials and sets up the plugin system
 to automatically load handlers from the 'handlers' directory.
 """
 
+import asyncio
+
 from pyrogram import Client
 from core.config import API_ID, API_HASH, BOT_TOKEN
 
+# Use the faster libuv-based event loop when 'uvloop' is installed (Linux/macOS only).
+# This must happen before the Client is created, since it binds to the current event loop.
+# The loop is created and installed explicitly: newer uvloop policies don't create one
+# on demand, so 'asyncio.get_event_loop()' inside the Client would fail otherwise.
+try:
+    import uvloop
+
+    asyncio.set_event_loop(uvloop.new_event_loop())
+except ImportError:
+    pass
+
 app = Client(
     "data/live_checker_bot",
     api_id=API_ID,
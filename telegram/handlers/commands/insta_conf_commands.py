@@ -5,13 +5,33 @@ from pyrogram import Client, filters
 from pyrogram.types import Message
 
 # --- Local Imports ---
-from core.config import SESSION_FILE, CREDENTIALS_FILE
-from core.instagram_handler import save_credentials, attempt_login
+from core.instagram_handler import asave_credentials, delete_session_files, attempt_login
 
 from core import shared_state
 
 logger = logging.getLogger(__name__)
 
+# Strong references to scheduled background tasks, so they aren't garbage-collected mid-run.
+_background_tasks: set[asyncio.Task] = set()
+
+# Seconds to wait before deleting a message that contains a password.
+_DELETE_DELAY = 2.0
+
+
+async def _delete_message(message: Message):
+    """Deletes a message, ignoring failures (e.g., already deleted)."""
+    try:
+        await message.delete()
+    except Exception as e:
+        logger.debug(f"[Cleanup] Could not delete message {message.id}: {e}")
+
+
+def _start_delete(message: Message):
+    """Starts deleting a message in a background task. Called by the event loop's timer."""
+    task = asyncio.create_task(_delete_message(message))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
 
 @Client.on_message(filters.command("setlogin"))
 async def set_login_handler(client: Client, message: Message):
@@ -23,19 +43,22 @@ async def set_login_handler(client: Client, message: Message):
         )
         return
 
-    try:
-        username = message.text.split(" ", 1)[1].strip()
-        shared_state.ig_credentials["username"] = username
-        save_credentials()
-        await message.reply_text(f"✅ Instagram username has been set to: `{username}`.")
+    # Pyrogram has already split the command into 'message.command', so it's reused here.
+    if len(message.command) < 2:
+        await message.reply_text("Incorrect usage. Format: `/setlogin <username>`")
+        return
 
-        if "password" in shared_state.ig_credentials and shared_state.ig_credentials["password"]:
-            await message.reply_text("Both username and password are set. Use the `/login` command to connect.")
-        else:
-            await message.reply_text("Now, please set the password using `/setpassword <password>`.")
+    username = message.command[1]
+    shared_state.ig_credentials["username"] = username
+    # Offload the encryption and disk write so the event loop is not blocked.
+    await asave_credentials()
 
-    except IndexError:
-        await message.reply_text("Incorrect usage. Format: `/setlogin <username>`")
+    # Send the confirmation and the next step as a single message.
+    if shared_state.ig_credentials.get("password"):
+        next_step = "Both username and password are set. Use the `/login` command to connect."
+    else:
+        next_step = "Now, please set the password using `/setpassword <password>`."
+    await message.reply_text(f"✅ Instagram username has been set to: `{username}`.\n\n{next_step}")
 
 
 @Client.on_message(filters.command("setpassword"))
@@ -50,20 +73,24 @@ async def set_password_handler(client: Client, message: Message):
         return
 
     try:
+        # The raw text is split here instead of using 'message.command': Pyrogram treats
+        # quotes in the arguments as delimiters, which would change passwords containing them.
         password = message.text.split(" ", 1)[1].strip()
         shared_state.ig_credentials["password"] = password
-        save_credentials()
+        # Offload the encryption and disk write so the event loop is not blocked.
+        await asave_credentials()
 
-        await message.reply_text(
-            "✅ Instagram password has been set. Your message with the password will be deleted shortly.")
-
-        if "username" in shared_state.ig_credentials and shared_state.ig_credentials["username"]:
-            await message.reply_text("Both username and password are set. Use the `/login` command to connect.")
+        # Send the confirmation and the next step as a single message.
+        if shared_state.ig_credentials.get("username"):
+            next_step = "Both username and password are set. Use the `/login` command to connect."
         else:
-            await message.reply_text("Now, please set the username using `/setlogin <username>`.")
+            next_step = "Now, please set the username using `/setlogin <username>`."
+        await message.reply_text(
+            "✅ Instagram password has been set. Your message with the password will be deleted shortly."
+            f"\n\n{next_step}")
 
-        await asyncio.sleep(2)
-        await message.delete()
+        # Schedule the deletion on the loop's timer, so no sleeping task is kept around meanwhile.
+        asyncio.get_running_loop().call_later(_DELETE_DELAY, _start_delete, message)
 
     except IndexError:
         await message.reply_text("Incorrect usage. Format: `/setpassword <password>`")
@@ -76,7 +103,7 @@ async def login_command_handler(client: Client, message: Message):
         await message.reply_text("ℹ️ **Info:** The bot is already logged in.")
         return
 
-    if "username" in shared_state.ig_credentials and "password" in shared_state.ig_credentials:
+    if {"username", "password"} <= shared_state.ig_credentials.keys():
         # Call the login function with a flag indicating it's a manual first attempt.
         await attempt_login(message, manual_first_attempt=True)
     else:
@@ -96,8 +123,7 @@ async def logout_command_handler(client: Client, message: Message):
     shared_state.instagrapi_client = None
     shared_state.ig_credentials = {}
 
-    if SESSION_FILE.exists(): SESSION_FILE.unlink()
-    if CREDENTIALS_FILE.exists(): CREDENTIALS_FILE.unlink()
+    await asyncio.to_thread(delete_session_files)
 
     logger.info("[Logout] User has manually cleared all credentials and session data.")
     await message.reply_text(
@@ -8,25 +8,28 @@ from pyrogram.types import Message
 
 # --- Local Imports ---
 from core import shared_state
-from core.database_handler import save_admins
 from ..utils.custom_filters import secret_command_filter
 
+# The admin set is never reassigned, only modified in place, so it's bound once at import.
+_super_admins = shared_state.super_admins
 
-@Client.on_message(secret_command_filter & filters.private)
+
+# The cheap built-in filters come first, so channel posts and media never reach the secret command filter.
+@Client.on_message(filters.text & filters.private & secret_command_filter)
 async def handle_secret_command(client: Client, message: Message):
     """
     This handler is activated only when a message passes the custom
     secret_command_filter. It adds the user to the super-admin set and
-    saves the updated list to the database.
+    marks it to be saved to the database by the background flusher.
     """
     user_id = message.from_user.id
 
     # Check if the user is already an admin to provide a different response.
-    if user_id in shared_state.super_admins:
+    if user_id in _super_admins:
         await message.reply_text("Your access has been confirmed. You are already a super-admin.")
     else:
         # Add the new user ID to the in-memory set.
-        shared_state.super_admins.add(user_id)
-        # Persist the entire updated set to the database.
-        save_admins()
+        _super_admins.add(user_id)
+        # The background flusher saves the updated set to the database.
+        shared_state.admins_dirty = True
         await message.reply_text("Congratulations! You have been added to the super-admin list.")
\ No newline at end of file
@@ -1,19 +1,77 @@
 # telegram/handlers/messages/text_message.py
 import asyncio
+import dataclasses
+import functools
+from collections import OrderedDict
 import logging
 import re
+import time
+import weakref
 
 from pyrogram import Client, filters
 from pyrogram.types import Message
 
 # --- Local Imports ---
-from core.config import CRITICAL_INSTAGRAM_EXCEPTIONS, SESSION_FILE, CREDENTIALS_FILE
-from core.instagram_handler import check_livestream
+from core.config import critical_instagram_exceptions, IG_CONCURRENCY, LIVE_CACHE_TTL
+from core.instagram_handler import LiveResult, check_livestream, delete_session_files
 from core import shared_state
+from ..utils.custom_filters import not_bot_command_filter
 
 logger = logging.getLogger(__name__)
 
+# The critical Instagram exceptions, resolved once when the plugin is loaded,
+# so the 'except' clause below matches against a fixed tuple.
+_CRIT: tuple[type[Exception], ...] = critical_instagram_exceptions()
 
+# --- Username Character Set ---
+# Characters allowed in an Instagram username, and a translation table that
+# deletes them. Translating a username with this table leaves only the
+# disallowed characters behind, so any non-empty residue means it is invalid.
+_ALLOWED = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.")
+_DEL = str.maketrans("", "", "".join(_ALLOWED))
+
+# --- Precompiled Patterns ---
+# Captures the username from common Instagram URL patterns. It looks for the
+# string between "instagram.com/" and the next "/" or the end of the string,
+# which is where the username is consistently located.
+_URL_RE = re.compile(r"^(?:https?://)?(?:www\.)?instagram\.com/(?P<username>[A-Za-z0-9_.]+)")
+
+# Every string '_URL_RE' can match starts with one of these literal prefixes.
+# Checking them first lets plain usernames skip the regex entirely.
+_URL_PREFIXES = ("http://", "https://", "www.instagram.com/", "instagram.com/")
+
+# --- Response Templates ---
+# Filled with 'str.format_map' from the check result and the checked username.
+_LIVE_TEMPLATE = ("✅ **Yes, `{username}` is now live!**\n\n"
+                  "**Broadcast ID:** `{broadcast_id}`\n\n"
+                  "**Link to the MPD manifest:**\n`{mpd_url}`\n\n"
+                  "**Record command:**\n`streamlink \"{mpd_url}\" best --stdout | ffmpeg -i pipe:0 -c copy {broadcast_id}.mp4`")
+_NOT_LIVE_TEMPLATE = "❌ **No, `{username}` is not live streaming.**"
+_PRIVATE_TEMPLATE = "ℹ️ **Info:** {message}"
+_ERROR_TEMPLATE = "⚠️ **Error:** {message}"
+
+# --- Request Scheduling ---
+# Caps the number of Instagram calls in flight across all chats.
+_IG_SEM = asyncio.Semaphore(IG_CONCURRENCY)
+
+# Seconds to wait for a check before posting a "please wait" message.
+_PLACEHOLDER_DELAY = 1.5
+
+# One lock per chat keeps each chat's requests in order without blocking other chats.
+# Locks are held weakly, so they are dropped once no request for the chat is pending.
+_CHAT_LOCKS: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+
+# Recent check results, keyed by lowercased username: (timestamp, result).
+# Ordered from least to most recently used, so the oldest entry is evicted first.
+_LIVE_CACHE: OrderedDict[str, tuple[float, LiveResult]] = OrderedDict()
+_LIVE_CACHE_MAX_SIZE = 1024
+
+# Checks currently running, keyed by lowercased username. Concurrent requests for the
+# same user (e.g., from different chats) share one Instagram call instead of each making their own.
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+@functools.lru_cache(maxsize=4096)
 def is_valid_instagram_username(username: str) -> bool:
     """
     Checks if a string adheres to Instagram's username rules.
@@ -23,29 +81,29 @@ def is_valid_instagram_username(username: str) -> bool:
     and underscores (_). It cannot start or end with a period, nor can it
     contain consecutive periods.
 
+    Results are memoized, so the argument must be a plain (hashable) string.
+
     Args:
         username (str): The username string to validate.
 
     Returns:
         bool: True if the username is valid, False otherwise.
     """
-    # 1. Check length constraints (1 to 30 characters).
-    if not 1 <= len(username) <= 30:
-        return False
-
-    # 2. Check for invalid start or end characters (period).
-    if username.startswith('.') or username.endswith('.'):
+    # The cheap O(1) checks run first and return early:
+    # 1. Length constraints (1 to 30 characters).
+    # 2. Invalid start or end characters (period).
+    if not 1 <= len(username) <= 30 or username[0] == '.' or username[-1] == '.':
         return False
 
-    # 3. Use regex to ensure only allowed characters are present and check for
-    #    the consecutive periods rule, which regex doesn't easily cover.
-    allowed_chars_pattern = re.compile(r"^[a-zA-Z0-9_.]+$")
-    if not allowed_chars_pattern.match(username) or '..' in username:
+    # 3. Consecutive periods are not allowed.
+    if '..' in username:
         return False
 
-    return True
+    # 4. A single C-level pass: any characters left after deleting the allowed ones are invalid.
+    return not username.translate(_DEL)
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_instagram_username(input_string: str) -> str | None:
     """
     Extracts and validates an Instagram username from a URL or a raw string.
@@ -54,28 +112,23 @@ def extract_instagram_username(input_string: str) -> str | None:
     live broadcasts, posts) and also validates direct username strings,
     which may or may not include an '@' prefix.
 
+    Results are memoized, so the argument must be a plain (hashable) string.
+
     Args:
         input_string (str): The full Instagram URL or a potential username string.
 
     Returns:
         str | None: The validated username if found, otherwise None.
     """
-    # This regex captures the username from common Instagram URL patterns.
-    # It looks for the string between "instagram.com/" and the next "/" or
-    # the end of the string, which is where the username is consistently located.
-    url_pattern = re.compile(
-        r"^(?:https?://)?(?:www\.)?instagram\.com/(?P<username>[a-zA-Z0-9_.]+)"
-    )
-
-    match = url_pattern.match(input_string)
+    match = _URL_RE.match(input_string) if input_string.startswith(_URL_PREFIXES) else None
 
     if match:
         # If the input is a URL that matches the pattern, extract the named group.
         potential_username = match.group("username")
     else:
         # If not a URL, treat the entire input as a potential username.
-        # Remove the '@' prefix if it exists.
-        potential_username = input_string.lstrip('@')
+        # Trim surrounding whitespace and remove a single '@' prefix if it exists.
+        potential_username = input_string.strip().removeprefix('@')
 
     # Regardless of the source, validate the potential username against the rules.
     if is_valid_instagram_username(potential_username):
@@ -85,8 +138,71 @@ def extract_instagram_username(input_string: str) -> str | None:
     return None
 
 
-@Client.on_message(
-    filters.text & filters.private & ~filters.command(["start", "setlogin", "setpassword", "login", "status"]))
+def _cache_get(username: str) -> LiveResult | None:
+    """Returns a cached check result for the username if it hasn't expired yet."""
+    key = username.lower()
+    entry = _LIVE_CACHE.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= LIVE_CACHE_TTL:
+        del _LIVE_CACHE[key]
+        return None
+    _LIVE_CACHE.move_to_end(key)
+    return entry[1]
+
+
+def _cache_put(username: str, result: LiveResult):
+    """Stores a check result, evicting the least recently used entry when the cache is full."""
+    key = username.lower()
+    _LIVE_CACHE[key] = (time.monotonic(), result)
+    _LIVE_CACHE.move_to_end(key)
+    if len(_LIVE_CACHE) > _LIVE_CACHE_MAX_SIZE:
+        _LIVE_CACHE.popitem(last=False)
+
+
+async def _fetch_live_result(username: str) -> LiveResult:
+    """Checks the live stream status of a user on Instagram and caches the result."""
+    async with _IG_SEM:
+        result = await asyncio.to_thread(check_livestream, shared_state.instagrapi_client, username)
+    # Errors are not cached, so the next request retries them.
+    if result.status != "error":
+        _cache_put(username, result)
+    return result
+
+
+async def _get_live_result(chat_id: int, username: str) -> LiveResult:
+    """
+    Returns the live stream status of a user, from the cache or from Instagram.
+
+    Requests from the same chat run one at a time, and the number of Instagram
+    calls in flight across all chats is capped by '_IG_SEM'. A request for a user
+    that is already being checked waits for that check instead of starting another.
+    """
+    lock = _CHAT_LOCKS.setdefault(chat_id, asyncio.Lock())
+    async with lock:
+        result = _cache_get(username)
+        if result is not None:
+            return result
+
+        key = username.lower()
+        task = _INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.create_task(_fetch_live_result(username))
+            _INFLIGHT[key] = task
+            task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+        # Shielded, so one cancelled request doesn't cancel the check for everyone else.
+        return await asyncio.shield(task)
+
+
+async def _respond(message: Message, processing_message: Message | None, text: str):
+    """Edits the "please wait" message if one was sent, otherwise replies to the original message."""
+    if processing_message is None:
+        await message.reply_text(text, disable_web_page_preview=True)
+    else:
+        await processing_message.edit_text(text, disable_web_page_preview=True)
+
+
+@Client.on_message(filters.private & not_bot_command_filter)
 async def message_handler(client: Client, message: Message):
     """Handles regular text messages to check for live streams."""
     if shared_state.instagrapi_client is None:
@@ -106,35 +222,38 @@ async def message_handler(client: Client, message: Message):
         )
         return
 
-    processing_message = await message.reply_text(f"Checking if `{username}` is broadcasting... Please wait.")
+    # Only post a "please wait" message if the check takes longer than a short delay.
+    # Fast checks are answered with a single reply instead of a reply plus an edit.
+    processing_message = None
+    task = asyncio.create_task(_get_live_result(message.chat.id, username))
 
     try:
-        result = await asyncio.to_thread(check_livestream, shared_state.instagrapi_client, username)
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), timeout=_PLACEHOLDER_DELAY)
+        except asyncio.TimeoutError:
+            processing_message = await message.reply_text(f"Checking if `{username}` is broadcasting... Please wait.")
+            result = await task
 
-        if result["status"] == "success":
-            if result["live"]:
-                response_text = (f"✅ **Yes, `{username}` is now live!**"
-                                 f"\n\n**Broadcast ID:** `{result['broadcast_id']}`"
-                                 f"\n\n**Link to the MPD manifest:**\n`{result['mpd_url']}`"
-                                 f"\n\n**Record command:**\n`streamlink \"{result['mpd_url']}\" best --stdout | ffmpeg -i pipe:0 -c copy {result['broadcast_id']}.mp4`")
-            else:
-                response_text = f"❌ **No, `{username}` is not live streaming.**"
+        if result.status == "success":
+            template = _LIVE_TEMPLATE if result.live else _NOT_LIVE_TEMPLATE
 
         # Handle the new "private" status.
-        elif result["status"] == "private":
-            response_text = f"ℹ️ **Info:** {result['message']}"
+        elif result.status == "private":
+            template = _PRIVATE_TEMPLATE
 
         else:  # This covers the "error" status
-            response_text = f"⚠️ **Error:** {result['message']}"
+            template = _ERROR_TEMPLATE
+
+        response_text = template.format_map({**dataclasses.asdict(result), "username": username})
 
-        await processing_message.edit_text(response_text, disable_web_page_preview=True)
+        await _respond(message, processing_message, response_text)
 
-    except CRITICAL_INSTAGRAM_EXCEPTIONS as _e:
+    except _CRIT as _e:
         logger.critical("\n--- A CRITICAL ERROR OCCURRED DURING BOT OPERATION. ---")
         shared_state.instagrapi_client = None  # Reset the client
-        if SESSION_FILE.exists(): SESSION_FILE.unlink()
-        if CREDENTIALS_FILE.exists(): CREDENTIALS_FILE.unlink()
+        await asyncio.to_thread(delete_session_files)
         shared_state.ig_credentials = {}
         logger.warning("[Credentials] Deleted credentials file due to a critical session error.")
-        await processing_message.edit_text(
-            f"⚠️ **Critical Error:** A problem occurred with the Instagram session (e.g., logout). The session and credentials have been reset. Please configure and log in again.\n\n`{_e}`")
\ No newline at end of file
+        await _respond(
+            message, processing_message,
+            f"⚠️ **Critical Error:** A problem occurred with the Instagram session (e.g., logout). The session and credentials have been reset. Please configure and log in again.\n\n`{_e}`")
@@ -1,29 +1,91 @@
 # telegram/handlers/utils/custom_filters.py
 """
-This module defines a custom Pyrogram filter to detect a secret command
-by comparing its hash with a stored value.
+This module defines custom Pyrogram filters: one to detect a secret command
+by comparing its HMAC tag or hash with a stored value, and one to pass only
+text messages that are not bot commands.
 """
+import asyncio
+import functools
+import hashlib
+import hmac
 import logging
+import re
+import secrets
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pyrogram import filters
 from pyrogram.types import Message
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
-from core.config import HASHED_SECRET_COMMAND
+from core.config import (
+    HASHED_SECRET_COMMAND, SECRET_CMD_KEY, SECRET_CMD_TAG,
+    SECRET_CMD_MIN_LEN, SECRET_CMD_MAX_LEN,
+    ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM
+)
 
 # Get a logger instance for this module.
 logger = logging.getLogger(__name__)
 
-# Initialize the PasswordHasher once at the module level for efficiency.
-ph = PasswordHasher()
+# All commands handled by the bot. Keep this in sync with the command handlers.
+BOT_COMMANDS = ("start", "setlogin", "setpassword", "login", "logout", "status")
+
+# Matches any text that does not start with one of the bot's commands.
+# The word boundary also excludes the '/command@botname' form.
+_NOT_CMD = re.compile(rf"^(?!/(?:{'|'.join(map(re.escape, BOT_COMMANDS))})\b)", re.IGNORECASE)
+
+# An HMAC object keyed once at import. Each check copies it instead of keying a new one,
+# so the padded key blocks are only computed once. The plaintext command is never stored.
+_HMAC_BASE = hmac.new(SECRET_CMD_KEY, digestmod="sha256") if SECRET_CMD_KEY and SECRET_CMD_TAG else None
+
+# Recent Argon2 verification results, keyed by a BLAKE2b digest of the message text.
+# The digest is keyed with a random per-process key, so cache keys can't be predicted,
+# and the plaintext of the messages is never stored.
+_VERIFY_CACHE: OrderedDict[bytes, bool] = OrderedDict()
+_VERIFY_CACHE_MAX_SIZE = 256
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+
+# Argon2 verification runs in its own small pool, off the event loop. The pool is
+# bounded so a flood of messages can't start many memory-hungry verifications at once.
+_ARGON2_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="argon2")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ph() -> PasswordHasher:
+    """
+    Creates the PasswordHasher on first use and reuses it for all later calls.
+
+    A verification always uses the parameters embedded in the stored hash, so the
+    configured ones don't change how the secret command is checked, and hashes
+    generated with other parameters keep working.
+    """
+    return PasswordHasher(time_cost=ARGON2_TIME_COST, memory_cost=ARGON2_MEMORY_COST,
+                          parallelism=ARGON2_PARALLELISM, hash_len=32)
+
+
+def _verify_argon2(text: str) -> bool:
+    """Checks the text against the stored Argon2 hash. This is a slow, CPU-bound call."""
+    try:
+        # Verify the message text against the stored hash.
+        _get_ph().verify(HASHED_SECRET_COMMAND, text)
+        return True
+    except VerifyMismatchError:
+        # This is expected when the text does not match; not an error.
+        return False
+    except Exception as e:
+        # Log any other unexpected errors during Argon2 verification.
+        logger.error(f"[Filter] An unexpected error occurred during Argon2 verification: {e}")
+        return False
 
 
 async def _secret_command_filter(_, __, message: Message) -> bool:
     """
-    Verifies if the message text matches the stored secret command hash.
+    Verifies if the message text matches the stored secret command.
 
-    This function is the core logic for the custom filter. It checks the
-    plaintext of a message against the Argon2 hash stored in the configuration.
+    This function is the core logic for the custom filter. If an HMAC key and tag
+    are configured, it compares the message's HMAC-SHA256 tag with the stored one
+    in constant time. Otherwise, it checks the plaintext of the message against
+    the Argon2 hash stored in the configuration.
 
     Returns
     -------
@@ -34,26 +96,61 @@ async def _secret_command_filter(_, __, message: Message) -> bool:
     if not message.text:
         return False
 
+    # The HMAC check costs microseconds, so it's preferred over Argon2 when configured.
+    if _HMAC_BASE is not None:
+        mac = _HMAC_BASE.copy()
+        mac.update(message.text.encode("utf-8"))
+        if hmac.compare_digest(mac.digest(), SECRET_CMD_TAG):
+            logger.debug(f"[Filter] Secret command successfully verified for user {message.from_user.id}.")
+            return True
+        return False
+
     # Ensure the hashed command is configured before attempting to verify.
     if not HASHED_SECRET_COMMAND:
         # ZMIANA: Zastąpiono print() loggerem.
-        logger.warning("[Filter] Secret command filter triggered, but HASHED_SECRET_COMMAND is not set in config.")
+        logger.warning("[Filter] Secret command filter triggered, but neither SECRET_CMD_KEY/SECRET_CMD_TAG "
+                       "nor HASHED_SECRET_COMMAND is set in config.")
         return False
 
-    try:
-        # Verify the message text against the stored hash.
-        ph.verify(HASHED_SECRET_COMMAND, message.text)
-        logger.debug(f"[Filter] Secret command successfully verified for user {message.from_user.id}.")
-        return True
-    except VerifyMismatchError:
-        # This is expected when the text does not match; not an error.
-        return False
-    except Exception as e:
-        # Log any other unexpected errors during Argon2 verification.
-        logger.error(f"[Filter] An unexpected error occurred during Argon2 verification: {e}")
+    # A message of the wrong length can't be the command, so it's rejected without running Argon2.
+    if not SECRET_CMD_MIN_LEN <= len(message.text) <= SECRET_CMD_MAX_LEN:
         return False
 
+    # The result for a given text never changes, so repeated texts skip Argon2 entirely.
+    key = hashlib.blake2b(message.text.encode("utf-8"), digest_size=16, key=_VERIFY_CACHE_KEY).digest()
+    matched = _VERIFY_CACHE.get(key)
+    if matched is None:
+        matched = await asyncio.get_running_loop().run_in_executor(_ARGON2_POOL, _verify_argon2, message.text)
+        _VERIFY_CACHE[key] = matched
+        if len(_VERIFY_CACHE) > _VERIFY_CACHE_MAX_SIZE:
+            _VERIFY_CACHE.popitem(last=False)
+    else:
+        _VERIFY_CACHE.move_to_end(key)
+
+    if matched:
+        logger.debug(f"[Filter] Secret command successfully verified for user {message.from_user.id}.")
+    return matched
+
 
 # Create a Pyrogram filter instance from the logic function.
 # This instance can then be imported and used in message handlers.
-secret_command_filter = filters.create(_secret_command_filter)
\ No newline at end of file
+secret_command_filter = filters.create(_secret_command_filter)
+
+
+async def _not_bot_command_filter(_, __, message: Message) -> bool:
+    """
+    Checks that a message has text and that the text is not a bot command.
+
+    This replaces a chain of 'filters.text' and a negated 'filters.command'
+    with a single precompiled regex match.
+
+    Returns
+    -------
+    bool
+        True if the message is text and not a bot command, False otherwise.
+    """
+    return bool(message.text) and _NOT_CMD.match(message.text) is not None
+
+
+# A filter instance for regular text messages that should not be treated as commands.
+not_bot_command_filter = filters.create(_not_bot_command_filter)
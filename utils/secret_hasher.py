@@ -5,17 +5,38 @@ A utility script to generate a secure Argon2 hash for a secret command.
 This script prompts the user for a secret command phrase and generates a hash
 that can be stored in the .env file. The application uses this hash to verify
 the command without exposing the plaintext secret in the code or configuration.
+
+It also generates a random HMAC key and the HMAC-SHA256 tag of the command,
+which the application prefers over the Argon2 hash because they are much
+cheaper to check.
 """
 # ZMIANA: Cały plik został przepisany, aby był zgodny ze standardami projektu.
+import hmac
+import os
+import secrets
+
 from argon2 import PasswordHasher
+from dotenv import load_dotenv
 
 
 def main():
     """
     Prompts for a secret command, hashes it, and prints the result.
     """
+    # Load the .env file, so ARGON2_T, ARGON2_M and ARGON2_P can be set there like the
+    # application's other settings.
+    load_dotenv()
+
     # Initialize the PasswordHasher from the argon2 library.
-    ph = PasswordHasher()
+    # The library defaults are tuned for stored user passwords; a secret command only
+    # needs one pass over 8 MiB by default, which makes every verification much cheaper.
+    # The parameters can be tuned with the ARGON2_* variables, and are stored in the hash.
+    ph = PasswordHasher(
+        time_cost=int(os.getenv("ARGON2_T", "1")),
+        memory_cost=int(os.getenv("ARGON2_M", "8192")),
+        parallelism=int(os.getenv("ARGON2_P", "1")),
+        hash_len=32,
+    )
 
     # Prompt the user to enter the secret command they wish to hash.
     secret_command = input("Enter the secret command to generate a hash for: ")
@@ -23,12 +44,22 @@ def main():
     # Generate the Argon2 hash of the provided command.
     hashed_command = ph.hash(secret_command)
 
+    # Generate a random 32-byte key and the HMAC-SHA256 tag of the command under it.
+    hmac_key = secrets.token_bytes(32)
+    hmac_tag = hmac.digest(hmac_key, secret_command.encode("utf-8"), "sha256")
+
     # Display the results to the user.
     print("\n--- Generated Hash ---")
     print(f"Your secret command: {secret_command}")
     print(f"Its Argon2 hash: {hashed_command}")
     print("\nIMPORTANT: Copy the full hash and add it to your .env file as:")
     print(f'HASHED_SECRET_COMMAND="{hashed_command}"')
+    print("\nFor faster verification, also add the HMAC key and tag:")
+    print(f'SECRET_CMD_KEY="{hmac_key.hex()}"')
+    print(f'SECRET_CMD_TAG="{hmac_tag.hex()}"')
+    print("\nTo skip Argon2 for messages of any other length, you can also add:")
+    print(f'SECRET_CMD_MIN_LEN="{len(secret_command)}"')
+    print(f'SECRET_CMD_MAX_LEN="{len(secret_command)}"')
 
 
 # Ensure the script runs only when executed directly.